@@ -1,29 +1,77 @@
 import argparse
+import atexit
 import json
+import queue
 import sys
 import os
-import re
 import logging
-import traceback
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict
 from gnews import GNews
 
 
-# Logger 설정
-logging.basicConfig()
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 
-# 파일 핸들러 추가 (로그 파일명 "google_news.log")
-log_file = "google_news.log"
-fh = logging.FileHandler(log_file)
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(formatter)
-logger.addHandler(fh)
+
+def _configure_logging(log_file: str = "google_news.log") -> None:
+    """
+    Logger 설정 (CLI 실행 시 main()에서 1회 호출)
+
+    모듈 import 시점에는 로그 파일을 열지 않도록 하고,
+    중복 호출 시 핸들러가 쌓이지 않게 함
+    """
+    if logger.hasHandlers():
+        return
+    logging.basicConfig()
+    logger.setLevel(logging.DEBUG)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # 파일 핸들러 추가 (로그 파일명 "google_news.log")
+    fh = logging.FileHandler(log_file)
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+    # 호출 스레드는 큐에 레코드만 넣고, 실제 파일 쓰기는 백그라운드 스레드가 담당
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, fh)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# 파일명에 쓸 수 없는 문자를 '_'로 바꾸는 변환 테이블 (모듈 로드 시 1회 생성)
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '\\/:*?"<>|'})
+
+# 결과 파일 쓰기용 버퍼 크기 (1MB) — 줄 단위 쓰기를 큰 블록으로 모아 write 호출을 줄임
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# orjson이 설치되어 있으면 C 확장 파서/인코더 사용 (없으면 표준 json으로 대체)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _dumps_compact = orjson.dumps
+else:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _dumps_compact(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False,
+                          separators=(',', ':')).encode("utf-8")
 
 
 def clean_filename(filename: str) -> str:
@@ -36,79 +84,173 @@ def clean_filename(filename: str) -> str:
     Returns:
         str: 안전한 파일명
     """
-    return re.sub(r'[\/:*?"<>|]', '_', filename)
+    return filename.translate(_FILENAME_TRANS)
 
 
 def load_existing_data(file_path: str) -> List:
     """
-    기존 JSON 파일을 불러와 리스트로 반환
+    기존 JSON Lines 결과 파일을 불러와 리스트로 반환
 
     Parameters:
-        file_path (str): 불러올 JSON 파일 경로
+        file_path (str): 불러올 JSONL 파일 경로
 
     Returns:
-        list: JSON 데이터 리스트 (없으면 빈 리스트 반환)
+        list: 줄 단위로 파싱한 데이터 리스트 (없으면 빈 리스트 반환)
+    """
+    try:
+        with open(file_path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    data = []
+    append = data.append
+    for line in lines:
+        if not line:
+            continue
+        try:
+            append(_loads(line))
+        except ValueError:
+            # 중단된 쓰기로 남은 불완전한 줄은 건너뜀
+            logger.warning("JSONL 줄 오류: %s", file_path)
+    return data
+
+
+def _migrate_json_to_jsonl(json_path: str, jsonl_path: str) -> None:
+    """기존 .json 배열 파일을 .jsonl(JSON Lines) 파일로 1회 변환"""
+    try:
+        with open(json_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return
+    try:
+        data = _loads(raw)
+    except ValueError:
+        logger.error("JSON 파일 오류: %s", json_path)
+        return
+    if not isinstance(data, list):
+        return
+    tmp_path = jsonl_path + ".tmp"
+    with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for item in data:
+            f.write(_dumps_compact(item))
+            f.write(b"\n")
+    os.replace(tmp_path, jsonl_path)
+    os.remove(json_path)
+    logger.info("%s 파일을 %s(JSON Lines)로 변환했습니다.", json_path, jsonl_path)
+
+
+def load_existing_urls(urls_path: str) -> Optional[set]:
     """
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-            except json.JSONDecodeError:
-                logger.error("JSON 파일 오류: %s", file_path)
-                return []
-    return []
+    결과 파일 옆의 .urls 사이드카에서 중복 검사용 URL 집합만 읽음
+
+    Parameters:
+        urls_path (str): 사이드카 파일 경로 (결과 파일 경로 + ".urls")
+
+    Returns:
+        set: 저장된 URL 집합 (사이드카가 없으면 None)
+    """
+    try:
+        with open(urls_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+    return {line.decode("utf-8") for line in raw.splitlines() if line}
+
+
+# 프로필 파일 파싱 결과 캐시: (경로, mtime_ns, size) -> 파싱된 dict
+_profiles_cache: Dict[tuple, Dict[str, Dict]] = {}
 
 
 def load_profiles(file_path: str = "search_profiles.json") -> Dict[str, Dict]:
-    """저장된 SearchProfile 목록을 불러옴"""
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                logger.error("JSON 파일을 불러올 수 없습니다.")
-    return {}
+    """저장된 SearchProfile 목록을 불러옴 (파일이 바뀌지 않았으면 캐시 재사용)"""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return {}
+    cache_key = (file_path, st.st_mtime_ns, st.st_size)
+    cached = _profiles_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return {}
+    try:
+        profiles = _loads(raw)
+    except ValueError:
+        logger.error("JSON 파일을 불러올 수 없습니다.")
+        return {}
+    _profiles_cache.clear()
+    _profiles_cache[cache_key] = profiles
+    return profiles
 
 
 def save_profiles(profiles: Dict[str, Dict],
                   file_path: str = "./search_profiles.json") -> None:
     """SearchProfile 목록 dict를 JSON 파일로 저장"""
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(profiles, f, ensure_ascii=False, indent=4)
+    with open(file_path, "wb") as f:
+        f.write(_dumps(profiles))
+    # 저장된 내용과 캐시가 어긋나지 않도록 무효화
+    _profiles_cache.clear()
 
 
-def edit_profile(args):
+def _profile_dict_from_args(args) -> Dict:
     """
-    SearchProfile을 수정하는 함수
+    'add' 모드 인자를 저장용 프로필 딕셔너리로 변환
+
+    SearchProfile 객체를 만들면 날짜 문자열을 datetime으로 파싱했다가
+    to_dict에서 다시 문자열로 되돌리므로, 저장만 할 때는 바로 딕셔너리를 구성
     """
-    profiles = load_profiles()
+    # 잘못된 날짜 문자열이 그대로 저장되지 않도록 형식만 검증 (파싱 결과는 버림)
+    if args.start_date:
+        datetime.fromisoformat(args.start_date)
+    if args.end_date:
+        datetime.fromisoformat(args.end_date)
+    return {
+        "language": args.language,
+        "country": args.country,
+        "period": args.period,
+        "start_date": args.start_date,
+        "end_date": args.end_date,
+        "max_results": args.max_results,
+        "exclude_websites": args.exclude if args.exclude else [],
+        "query": args.query
+    }
+
+
+def edit_profile(args, profiles: Dict[str, Dict]):
+    """
+    SearchProfile을 수정하는 함수
 
+    Parameters:
+        args: 파싱된 커맨드라인 인자
+        profiles (dict): 이미 불러온 SearchProfile 목록 (재로드 방지)
+    """
     if args.name not in profiles:
-        logger.error(f"{args.name} 프로필을 찾을 수 없습니다.")
+        logger.error("%s 프로필을 찾을 수 없습니다.", args.name)
         return
 
     profile_data = profiles[args.name]
 
     # 수정할 요소들을 key-value 딕셔너리로 변환
     if args.att is not None:
-        updates = {key: value for key, value in args.att}
-        logger.info(f"수정할 속성: {updates}")
-
-        # 기존 프로필 업데이트
-        for key, value in updates.items():
-            if key in profile_data:
-                old = profile_data[key]
-                profile_data[key] = value
-                logger.info(f"{key} : {old} -> {value} 변경되었습니다.")
-            else:
-                logger.warning(f"{key}는 존재하지 않는 속성입니다.")
+        updates = dict(args.att)
+        logger.info("수정할 속성: %s", updates)
+
+        # 존재하는 속성과 아닌 속성을 집합 연산으로 한 번에 분리해 일괄 갱신
+        valid_keys = updates.keys() & profile_data.keys()
+        for key in updates.keys() - valid_keys:
+            logger.warning("%s는 존재하지 않는 속성입니다.", key)
+        for key in valid_keys:
+            logger.info("%s : %s -> %s 변경되었습니다.",
+                        key, profile_data[key], updates[key])
+        profile_data.update((key, updates[key]) for key in valid_keys)
 
         # 업데이트된 프로필 저장
         profiles[args.name] = profile_data
         save_profiles(profiles)
-        logger.info(f"{args.name} 프로필이 수정되었습니다.")
+        logger.info("%s 프로필이 수정되었습니다.", args.name)
 
 
 class SearchProfile:
@@ -127,6 +269,10 @@ class SearchProfile:
         proxy: 프록시 설정 (기본값 None → 빈 딕셔너리)
     """
 
+    __slots__ = ('language', 'country', 'period', 'start_date', 'end_date',
+                 'max_results', 'exclude_websites', 'proxy', 'query',
+                 'results')
+
     def __init__(self,
                  language: str,
                  country: str,
@@ -140,12 +286,13 @@ class SearchProfile:
         self.language = language
         self.country = country
         self.period = period
+        # fromisoformat은 C로 구현되어 strptime보다 훨씬 빠름 (형식은 동일하게 YYYY-MM-DD)
         if start_date:
-            self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
+            self.start_date = datetime.fromisoformat(start_date)
         else:
             self.start_date = None
         if end_date:
-            self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
+            self.end_date = datetime.fromisoformat(end_date)
         else:
             self.end_date = None
         self.max_results = max_results
@@ -160,27 +307,72 @@ class SearchProfile:
             folder_path: str = './google_news_search_result'
     ) -> None:
         """
-        기존 데이터 리스트에 새로운 검색 결과(self.results)를 추가하여
-        JSON 파일({language}_{country}_{query}.json)로 저장
+        새로운 검색 결과(self.results)를 JSON Lines 파일
+        ({language}_{country}_{query}.jsonl)에 덧붙여 저장
+
+        전체 기록을 다시 쓰지 않고 새 항목만 추가하므로
+        파일이 커져도 저장 비용은 새 결과 개수에만 비례
 
         Parameters:
             folder_path (str): 저장할 폴더 경로 (기본값 './google_news_search_result')
         """
         os.makedirs(folder_path, exist_ok=True)
-        file_name = clean_filename(
-            f"{self.language}_{self.country}_{self.query}.json"
+        base_name = clean_filename(
+            f"{self.language}_{self.country}_{self.query}"
         )
-        file_path = os.path.join(folder_path, file_name)
-        existing_results = load_existing_data(file_path)
+        file_path = os.path.join(folder_path, base_name + ".jsonl")
+        # 이전 버전이 남긴 .json 배열 파일이 있으면 1회 변환
+        if not os.path.exists(file_path):
+            _migrate_json_to_jsonl(
+                os.path.join(folder_path, base_name + ".json"), file_path
+            )
         # 중복 제거 (링크를 기준으로 중복 방지)
-        existing_links = {item["url"] for item in existing_results}
-        combined_results = existing_results + [
-            item for item in self.results
-            if item["url"] not in existing_links
-        ]
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(combined_results, f, ensure_ascii=False, indent=4)
-        logger.info(f"검색 결과가 {file_path}에 저장되었습니다.")
+        # URL 집합은 .urls 사이드카에서 읽고, 없을 때만 기존 기록을 훑어 복원
+        urls_path = file_path + ".urls"
+        seen_links = load_existing_urls(urls_path)
+        had_url_index = seen_links is not None
+        if not had_url_index:
+            seen_links = {item["url"] for item in load_existing_data(file_path)}
+        add_link = seen_links.add
+        new_items = []
+        for item in self.results:
+            url = item["url"]
+            if url not in seen_links:
+                add_link(url)
+                new_items.append(item)
+        # 새로 추가할 항목이 없으면 파일을 건드리지 않고 종료
+        # (사이드카를 새로 복원한 경우에는 다음 실행을 위해 저장까지 진행)
+        if had_url_index and not new_items:
+            logger.info("추가할 새 검색 결과가 없습니다: %s", file_path)
+            return
+        # 이전 쓰기가 중단돼 파일이 개행 없이 끝났다면
+        # 첫 새 레코드가 그 불완전한 줄에 이어붙지 않도록 개행을 먼저 보정
+        needs_newline = False
+        try:
+            with open(file_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+        except OSError:
+            pass  # 파일이 없거나 비어 있으면 보정 불필요
+        # 새 항목만 줄 단위로 덧붙임 (닫을 때 한 번에 플러시)
+        with open(file_path, "ab", buffering=_WRITE_BUFFER_SIZE) as f:
+            if needs_newline:
+                f.write(b"\n")
+            for item in new_items:
+                f.write(_dumps_compact(item))
+                f.write(b"\n")
+        if had_url_index:
+            with open(urls_path, "ab", buffering=_WRITE_BUFFER_SIZE) as f:
+                for item in new_items:
+                    f.write(item["url"].encode("utf-8"))
+                    f.write(b"\n")
+        else:
+            urls_tmp = urls_path + ".tmp"
+            with open(urls_tmp, "wb") as f:
+                f.write("\n".join(sorted(seen_links)).encode("utf-8"))
+                f.write(b"\n")
+            os.replace(urls_tmp, urls_path)
+        logger.info("검색 결과가 %s에 저장되었습니다.", file_path)
 
     def to_dict(self) -> dict:
         """프로필 저장을 위해 SearchProfile 객체를 딕셔너리로 변환"""
@@ -188,9 +380,9 @@ class SearchProfile:
             "language": self.language,
             "country": self.country,
             "period": self.period,
-            "start_date": (self.start_date.strftime("%Y-%m-%d")
+            "start_date": (self.start_date.date().isoformat()
                            if self.start_date else None),
-            "end_date": (self.end_date.strftime("%Y-%m-%d")
+            "end_date": (self.end_date.date().isoformat()
                          if self.end_date else None),
             "max_results": self.max_results,
             "exclude_websites": self.exclude_websites,
@@ -203,6 +395,34 @@ class SearchProfile:
         return SearchProfile(**data)
 
 
+# 스레드별 GNews 클라이언트 보관소 (requests 세션은 스레드 간 공유가 안전하지 않음)
+_thread_state = threading.local()
+
+
+def _get_client(profile: SearchProfile) -> GNews:
+    """프로필 설정을 적용한 스레드별 GNews 클라이언트를 반환 (스레드당 1회 생성)"""
+    client = getattr(_thread_state, "client", None)
+    # proxy는 GNews 생성자에서만 반영되므로 (속성 setter 없음)
+    # 프록시가 달라지면 클라이언트를 새로 만듦
+    if client is None or getattr(_thread_state, "proxy", None) != profile.proxy:
+        client = _thread_state.client = GNews(proxy=profile.proxy)
+        _thread_state.proxy = profile.proxy
+    client.language = profile.language
+    client.country = profile.country
+    client.period = profile.period
+    # 이전 프로필의 날짜가 남아 있으면 setter의 기간 검증이 None과 비교하다
+    # 실패하므로, 내부 값을 비운 뒤 지정된 날짜만 다시 적용
+    client._start_date = None
+    client._end_date = None
+    if profile.start_date is not None:
+        client.start_date = profile.start_date
+    if profile.end_date is not None:
+        client.end_date = profile.end_date
+    client.max_results = profile.max_results
+    client.exclude_websites = profile.exclude_websites
+    return client
+
+
 def google_news_search(profile: SearchProfile) -> None:
     """
     GNews 패키지를 사용하여 구글 뉴스 검색 결과를 가져오고 저장.
@@ -214,22 +434,31 @@ def google_news_search(profile: SearchProfile) -> None:
     Returns:
         JSON 파일
     """
-    google_news = GNews(
-        language=profile.language,
-        country=profile.country,
-        period=profile.period,
-        start_date=profile.start_date,
-        end_date=profile.end_date,
-        max_results=profile.max_results,
-        exclude_websites=profile.exclude_websites,
-        proxy=profile.proxy
-    )
+    google_news = _get_client(profile)
     profile.results = google_news.get_news(profile.query)
-    logger.info(f"{len(profile.results)}개의 검색 결과를 찾았습니다.")
+    logger.info("%d개의 검색 결과를 찾았습니다.", len(profile.results))
     profile.save_as_json()
 
 
+def google_news_search_many(profiles: List[SearchProfile]) -> None:
+    """
+    여러 SearchProfile을 병렬 검색 (네트워크 대기를 겹쳐 전체 시간을 단축)
+
+    소켓 I/O 중에는 GIL이 풀리므로 스레드 풀만으로도 요청이 실제로 겹침.
+    각 워커 스레드는 자체 GNews 클라이언트를 사용
+
+    Parameters:
+        profiles (list): 검색할 SearchProfile 목록
+    """
+    if not profiles:
+        return
+    max_workers = min(16, len(profiles))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(google_news_search, profiles))
+
+
 def main() -> None:
+    _configure_logging()
     try:
         parser = argparse.ArgumentParser(description="Google Search")
         subparsers = parser.add_subparsers(dest="mode")
@@ -311,11 +540,11 @@ def main() -> None:
         if args.mode == 'use':
             if args.name in profiles:
                 profile = SearchProfile.from_dict(profiles[args.name])
-                logger.info(f"'{args.name}' 프로필이 선택되었습니다.")
+                logger.info("'%s' 프로필이 선택되었습니다.", args.name)
 
                 google_news_search(profile)
             else:
-                logger.error(f"'{args.name}' 프로필을 찾을 수 없습니다.")
+                logger.error("'%s' 프로필을 찾을 수 없습니다.", args.name)
                 return
 
         elif args.mode == 'add':
@@ -325,27 +554,17 @@ def main() -> None:
                     " --start_date와 --end_date를 함께 제공해야 합니다."
                 )
 
-            profile = SearchProfile(
-                language=args.language,
-                country=args.country,
-                period=args.period,
-                start_date=args.start_date,
-                end_date=args.end_date,
-                max_results=args.max_results,
-                exclude_websites=args.exclude,
-                query=args.query
-            )
-            profiles[args.name] = profile.to_dict()
+            profiles[args.name] = _profile_dict_from_args(args)
             save_profiles(profiles)
-            logger.info(f"'{args.name}' 프로필이 저장되었습니다.")
+            logger.info("'%s' 프로필이 저장되었습니다.", args.name)
 
         elif args.mode == 'edit':
-            edit_profile(args)
+            edit_profile(args, profiles)
 
         elif args.mode == 'del':
             del profiles[args.name]
             save_profiles(profiles)
-            logger.info(f"'{args.name}' 프로필이 삭제되었습니다.")
+            logger.info("'%s' 프로필이 삭제되었습니다.", args.name)
 
         else:
             logger.error(
@@ -355,7 +574,6 @@ def main() -> None:
             return
     except Exception as e:
         logger.exception("실행 중 예외 발생: %s", e)
-        logger.error(traceback.format_exc())
 
 if __name__ == "__main__":
     main()